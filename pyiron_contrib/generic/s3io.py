@@ -1,16 +1,107 @@
 import fnmatch
+import heapq
 import io
 import json
 import os
 import posixpath
+import re
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from functools import lru_cache
+from tempfile import NamedTemporaryFile
+from types import MappingProxyType
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.client import Config
+from botocore.exceptions import ClientError
 
 from pyiron_base import HasGroups
 from pyiron_base import load_file, FileDataTemplate
 
+# Shared pool for concurrent transfers; the boto3 client is thread safe, the resource objects are not.
+_executor = ThreadPoolExecutor(max_workers=min(32, 4 * (os.cpu_count() or 1)))
+# Objects above the threshold are transferred in parts over several connections, downloaded parts are written to
+# their offset in the target file in 1 MiB blocks.
+_transfer_config = TransferConfig(
+    multipart_threshold=8 * 2**20,
+    multipart_chunksize=16 * 2**20,
+    max_concurrency=16,
+    io_chunksize=2**20,
+    use_threads=True,
+)
+# Enough pooled connections for the concurrent transfers above, botocore defaults to 10.
+_pool_config = Config(max_pool_connections=64, retries={'mode': 'standard', 'max_attempts': 5})
+# A single copy_object request is limited to 5 GiB, the system headers, storage class and encryption settings are
+# reset when replacing the metadata.
+_max_copy_object_size = 5 * 2**30
+_preserved_headers = (
+    'ContentType', 'ContentEncoding', 'ContentDisposition', 'ContentLanguage', 'CacheControl', 'Expires',
+    'StorageClass', 'ServerSideEncryption', 'SSEKMSKeyId', 'WebsiteRedirectLocation'
+)
+
+
+@lru_cache(maxsize=32)
+def _load_credentials_file(path, mtime):
+    """
+    Parse a json credentials file, the cache is invalidated by a change of the modification time.
+
+    Args:
+        path (str): path to the json file.
+        mtime (float): modification time of the file, only used as cache key.
+
+    Returns:
+        MappingProxyType: read only view on the parsed credentials.
+    """
+    with open(path) as json_file:
+        return MappingProxyType(json.load(json_file))
+
+
+def _results(futures):
+    """
+    Wait for all futures to finish before raising the first exception, such that no transfer is still running.
+
+    Args:
+        futures (list): futures of the shared thread pool.
+
+    Returns:
+        list: results of the futures in the given order.
+    """
+    wait(futures)
+    return [future.result() for future in futures]
+
+
+def _is_hashable(obj):
+    try:
+        hash(obj)
+    except TypeError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=32)
+def _get_s3resource(credential_items, config=None, thread_id=None):
+    """
+    Create a boto3 S3 resource, cached per set of credentials and thread.
+
+    Constructing the session and resource is expensive, hence connections using the same credentials share one
+    resource. boto3 resources are not thread safe, therefore each thread gets its own resource.
+
+    Args:
+        credential_items (tuple): sorted (key, value) pairs passed on to boto3.resource.
+        config (botocore.client.Config/None): botocore configuration, None uses path addressing. Values set here take
+            precedence over the default connection pool settings.
+        thread_id (int/None): identifier of the calling thread, only used as cache key.
+
+    Returns:
+        boto3.resource: S3 resource
+    """
+    if config is None:
+        config = Config(s3={'addressing_style': 'path'})
+    return boto3.resource('s3', config=_pool_config.merge(config), **dict(credential_items))
+
 
 class S3FileData(FileDataTemplate):
     """FileData stores an instance of a data file from an S3 system, e.g. a single Image from a measurement."""
@@ -25,28 +116,38 @@ class S3FileData(FileDataTemplate):
         """
         self._s3obj = s3obj
         if filename is None:
-            self.filename = s3obj.key.split('/')[-1]
+            self.filename = s3obj.key.rsplit('/', 1)[-1]
         else:
             self.filename = filename
         if filetype is None:
-            filetype = os.path.splitext(self.filename)[1]
-            if filetype == '' or filetype == '.':
-                self.filetype = None
+            dot = self.filename.rfind('.')
+            # no extension for hidden files like '.name' and for names ending with '.'
+            if 0 < dot < len(self.filename) - 1:
+                self.filetype = self.filename[dot + 1:]
             else:
-                self.filetype = filetype[1:]
+                self.filetype = None
         else:
             self.filetype = filetype
         self._data = None
+        self._decoded = None
         self._metadata = self._s3obj.metadata
 
     @property
-    @lru_cache()
     def data(self):
         """Return the associated data."""
+        if self._decoded is not None:
+            return self._decoded
         if self._data is None:
-            self._s3obj = self._s3obj.get()
-            self._data = self._s3obj["Body"].read()
-        return load_file(io.BytesIO(self._data), filetype=self.filetype)
+            response = self._s3obj.get()
+            # small objects stay in memory, large ones are streamed to a temporary file instead of being held as bytes
+            if response["ContentLength"] > 64 * 2**20:
+                self._data = NamedTemporaryFile()
+            else:
+                self._data = io.BytesIO()
+            shutil.copyfileobj(response["Body"], self._data, 2**20)
+        self._data.seek(0)
+        self._decoded = load_file(self._data, filetype=self.filetype)
+        return self._decoded
 
     @property
     def metadata(self):
@@ -89,6 +190,8 @@ class S3ioConnect:
         self.bucket_name = bucket_name or self.bucket_name
         self._check_for_bucket_name()
         self.bucket = self.s3resource.Bucket(self.bucket_name)
+        # listings of groups shared by all FileS3IO objects using this connection, {(bucket, prefix): (time, content)}
+        self._listing_cache = {}
 
     def _init_s3resource(self, credentials):
         if isinstance(credentials, boto3.resources.base.ServiceResource):
@@ -96,11 +199,11 @@ class S3ioConnect:
         elif credentials is None:
             # boto3 looks for the (missing) credentials at  ~/.aws/credentials or at environment variables:
             # AWS_ACCESS_KEY_ID  AWS_SECRET_ACCESS_KEY  etc.
-            return boto3.resource('s3')
+            return boto3.resource('s3', config=_pool_config)
         else:
             credentials = self._get_credentials_dict(credentials)
 
-            config = credentials.pop('config', Config(s3={'addressing_style': 'path'}))
+            config = credentials.pop('config', None)
 
             self._normalize_key(credentials, 'aws_access_key_id', 'access_key')
             self._normalize_key(credentials, 'aws_secret_access_key', 'secret_key')
@@ -108,7 +211,24 @@ class S3ioConnect:
 
             self.bucket_name = credentials.pop("bucket", None)
 
-            return boto3.resource('s3', config=config, **credentials)
+            credential_items = tuple(sorted(credentials.items()))
+            if _is_hashable((credential_items, config)):
+                return _get_s3resource(credential_items, config, threading.get_ident())
+            # unhashable credential values cannot be cached
+            return _get_s3resource.__wrapped__(credential_items, config)
+
+    def _invalidate_listing(self, bucket_name, key):
+        """
+        Drop the cached listings affected by a change of `key`, i.e. of all groups containing it and, if `key` is a
+        group itself, of all its sub groups.
+
+        Args:
+            bucket_name (str): name of the modified bucket.
+            key (str): modified key or group prefix inside the bucket.
+        """
+        for cached_bucket, prefix in list(self._listing_cache):
+            if cached_bucket == bucket_name and (key.startswith(prefix) or prefix.startswith(key)):
+                self._listing_cache.pop((cached_bucket, prefix), None)
 
     def _check_for_bucket_name(self):
         if self.bucket_name is None:
@@ -123,8 +243,7 @@ class S3ioConnect:
     @staticmethod
     def _get_credentials_dict(credentials):
         if isinstance(credentials, str):
-            with open(credentials) as json_file:
-                credentials = json.load(json_file)
+            credentials = dict(_load_credentials_file(credentials, os.path.getmtime(credentials)))
         if not isinstance(credentials, dict):
             raise TypeError(f"credentials is not one of the supported types but {type(credentials)}.")
         return credentials.copy()
@@ -147,12 +266,27 @@ class FileS3IO(HasGroups):
         download: download (list of) files to the specified folder.
         get: receive a S3FileData from the storage
         get_s3_object: receive a native s3.Object from the store
+        get_ranges: receive several byte ranges of a file
         get_metadata: receive only the meta data from the specified file
 
+    The meta data of a file may be replaced using
+        set_metadata: replace the meta data of the specified file without transferring the data.
+
+    The listing of a group (list_groups, list_nodes, list_all, indexing) is reused for `_listing_ttl` seconds. The
+    cache is shared by all objects using the same connection, e.g. the ones returned by open() and copy(), and
+    changes made through any of them invalidate it. Changes made by other connections or processes may only become
+    visible after that time. Set `_listing_ttl = 0` on the instance or the class to always list the bucket anew.
+
     Attributes:
         s3_path: absolute path (starting with '/') inside the bucket, interpreting '/' as the directory separator.
         bucket_info: dict with name and endpoint of the bucket.
     """
+    # seconds for which a listing of the current group is reused, e.g. by list_groups() followed by list_nodes(),
+    # 0 disables the reuse
+    _listing_ttl = 5
+    # maximal number of sub groups listed concurrently by glob, wider trees are listed page by page
+    _glob_fanout = 32
+
     def __init__(self, config=None, path='/', *, bucket_name=None):
         """
         Establishes connection to a specific 'bucket' of a S3 type object store.
@@ -183,6 +317,7 @@ class FileS3IO(HasGroups):
             self._s3io = S3ioConnect(credentials=config, bucket_name=bucket_name)
 
         self._bucket = self._s3io.bucket
+        self._client = self._s3io.s3resource.meta.client
         self._s3_path = None
         self.s3_path = path
 
@@ -231,39 +366,63 @@ class FileS3IO(HasGroups):
         """
         List directories/groups in the current group.
 
+        The listing may be up to `_listing_ttl` seconds old, see :class:`FileS3IO`.
+
         Returns:
             list: list of directory names.
         """
-        groups = []
-        group_path_len = len(self._bucket_path.split('/')) - 1
-        for obj in self._list_objects():
-            rel_obj_path_spl = obj.key.split('/')[group_path_len:]
-            if len(rel_obj_path_spl) > 1:
-                if rel_obj_path_spl[0] not in groups:
-                    groups.append(rel_obj_path_spl[0])
-        return groups
+        return list(self._list_group_content()[0])
 
     def _list_nodes(self):
         """
         List of 'files' ( string not followed by '/' ) in the current group.
 
+        The listing may be up to `_listing_ttl` seconds old, see :class:`FileS3IO`.
+
         Returns:
             list: list of file names.
         """
+        return list(self._list_group_content()[1])
+
+    def _list_group_content(self):
+        """
+        List the direct sub groups and nodes of the current group.
+
+        Uses a delimited listing, such that S3 only returns the children of the current group instead of all objects
+        of the subtree. The result is reused for `_listing_ttl` seconds or until the group is modified through this
+        connection.
+
+        Returns:
+            tuple: (list of group names, list of node names)
+        """
+        now = time.monotonic()
+        prefix = self._bucket_path
+        cache_key = (self._bucket.name, prefix)
+        cached = self._s3io._listing_cache.get(cache_key)
+        if cached is not None and now - cached[0] < self._listing_ttl:
+            return cached[1]
+        groups = []
         nodes = []
-        for obj in self._bucket.objects.filter(Prefix=self._bucket_path, Delimiter='/'):
-            nodes.append(obj.key.split('/')[-1])
-        return nodes
+        prefix_len = len(prefix)
+        paginator = self._client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self._bucket.name, Prefix=prefix, Delimiter='/'):
+            groups.extend(p['Prefix'][prefix_len:-1] for p in page.get('CommonPrefixes', []))
+            nodes.extend(obj['Key'][prefix_len:] for obj in page.get('Contents', []) if obj['Key'] != prefix)
+        self._s3io._listing_cache[cache_key] = (now, (groups, nodes))
+        return groups, nodes
 
     def _to_abs_bucketpath(self, path):
         """Helper function to convert a given path to an absolute path inside the S3 bucket."""
-        if path is None or "":
-            path = self._bucket_path
+        return self._abs_bucketpath(self._bucket_path, path)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _abs_bucketpath(bucket_path, path):
+        if not path:
+            return bucket_path
         if posixpath.isabs(path):
-            path = path[1:]
-        else:
-            path = self._bucket_path + path
-        return path
+            return path[1:]
+        return bucket_path + path
 
     def is_dir(self, path):
         """
@@ -276,10 +435,10 @@ class FileS3IO(HasGroups):
             bool: True if path is a directory.
         """
         path = self._to_abs_bucketpath(path)
-        if len(path) > 1 and path[-1] != '/':
+        if len(path) > 0 and path[-1] != '/':
             path = path + '/'
-        objs = list(self._bucket.objects.filter(Prefix=path))
-        return len(objs) > 0
+        response = self._client.list_objects_v2(Bucket=self._bucket.name, Prefix=path, MaxKeys=1)
+        return response.get('KeyCount', 0) > 0
 
     def is_file(self, path):
         """
@@ -292,11 +451,15 @@ class FileS3IO(HasGroups):
             bool: True if path is a file.
         """
         path = self._to_abs_bucketpath(path)
-        objs = list(self._bucket.objects.filter(Prefix=path))
-        for obj in objs:
-            if obj.key == path:
-                return True
-        return False
+        if len(path) == 0 or path[-1] == '/':
+            return False
+        try:
+            self._client.head_object(Bucket=self._bucket.name, Key=path)
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey'):
+                return False
+            raise
+        return True
 
     def open(self, group):
         """
@@ -342,14 +505,21 @@ class FileS3IO(HasGroups):
         if isinstance(files, str):
             files = [files]
 
+        bucket_name = self._bucket.name
+        prefix = self._bucket_path
+        self._s3io._invalidate_listing(bucket_name, prefix)
+        extra_args = {"Metadata": metadata}
+        futures = []
         for file in files:
-            [_, filename] = os.path.split(file)
-
-            self._bucket.upload_file(
+            futures.append(_executor.submit(
+                self._client.upload_file,
                 file,
-                self._bucket_path + filename,
-                {"Metadata": metadata}
-            )
+                bucket_name,
+                prefix + os.path.basename(file),
+                extra_args,
+                Config=_transfer_config
+            ))
+        _results(futures)
 
     def download(self, files, targetpath="."):
         """
@@ -364,10 +534,18 @@ class FileS3IO(HasGroups):
         if isinstance(files, str):
             files = [files]
 
+        futures = []
         for f in files:
             filepath = os.path.join(targetpath, f.split("/")[-1])
             print(filepath)
-            self._bucket.download_file(self._bucket_path + f, filepath)
+            futures.append(_executor.submit(
+                self._client.download_file,
+                self._bucket.name,
+                self._bucket_path + f,
+                filepath,
+                Config=_transfer_config
+            ))
+        _results(futures)
 
     def get_metadata(self, file):
         """
@@ -379,7 +557,29 @@ class FileS3IO(HasGroups):
              dict: metadata field associated with the file.
         """
         file = self._to_abs_bucketpath(file)
-        return self._bucket.Object(file).metadata
+        return self._client.head_object(Bucket=self._bucket.name, Key=file)['Metadata']
+
+    def set_metadata(self, file, metadata):
+        """
+        Replaces the metadata of a file.
+
+        The object is copied onto itself on the server side, hence no data is transferred. System headers like the
+        Content-Type, the storage class and the server side encryption settings are preserved. Objects larger than
+        5 GiB, the limit of a single copy request, are copied as managed multipart copy.
+
+        Args:
+            file (str): path to a file of the bucket.
+            metadata (dict): new metadata (has to be a dictionary of type {"string": "string", }).
+        """
+        file = self._to_abs_bucketpath(file)
+        head = self._client.head_object(Bucket=self._bucket.name, Key=file)
+        extra_args = {key: head[key] for key in _preserved_headers if key in head}
+        extra_args.update(Metadata=metadata, MetadataDirective='REPLACE')
+        copy_source = {'Bucket': self._bucket.name, 'Key': file}
+        if head['ContentLength'] > _max_copy_object_size:
+            self._client.copy(copy_source, self._bucket.name, file, ExtraArgs=extra_args, Config=_transfer_config)
+        else:
+            self._client.copy_object(Bucket=self._bucket.name, Key=file, CopySource=copy_source, **extra_args)
 
     def get(self, file):
         """
@@ -405,6 +605,37 @@ class FileS3IO(HasGroups):
         file = self._to_abs_bucketpath(file)
         return self._bucket.Object(file).get()
 
+    def get_ranges(self, file, ranges):
+        """
+        Returns several byte ranges of a file, the ranges are requested concurrently.
+
+        Args:
+            file(str): a path like string.
+            ranges(list): list of (start, stop) tuples of non-negative integers, with slice semantics, i.e. stop is
+                not included, stop <= start gives an empty range and bounds past the end of the file are clipped.
+        Returns:
+            list: bytes of each range in the order of `ranges`.
+        """
+        for start, stop in ranges:
+            for bound in (start, stop):
+                if not isinstance(bound, int) or isinstance(bound, bool) or bound < 0:
+                    raise ValueError(f"Range bounds have to be non-negative integers, got {(start, stop)}.")
+        file = self._to_abs_bucketpath(file)
+        futures = [_executor.submit(self._get_range, file, start, stop) for start, stop in ranges]
+        return _results(futures)
+
+    def _get_range(self, key, start, stop):
+        if stop <= start:
+            return b''
+        try:
+            response = self._client.get_object(Bucket=self._bucket.name, Key=key, Range=f"bytes={start}-{stop - 1}")
+        except ClientError as e:
+            # S3 rejects ranges starting at or past the end of the object, like a slice these are empty
+            if e.response['Error']['Code'] == 'InvalidRange':
+                return b''
+            raise
+        return response["Body"].read()
+
     def put(self, data_obj, filename=None, path=None, metadata=None):
         """
         Upload a data_obj to the current group/ the provided path.
@@ -412,14 +643,12 @@ class FileS3IO(HasGroups):
         Args:
             data_obj( <class 'bytes'>, <class 'bytearray'>, file-like object): data object to upload the data from.
             filename(str/None): Name under which the data_obj will be stored.
-            path(str/None): path to upload the data to, None means currently opened group.
+            path(str/None): path to upload the data to, None means currently opened group. Like any group in the S3
+                  store, the path does not need to exist beforehand.
             metadata(dict/None): metadata to be used (has to be a dictionary of type {"string": "string", }).
                   Provided metadata overwrites the one possibly present in the data object.
         """
-        if self.is_dir(path):
-            path = self._to_abs_bucketpath(path)
-        else:
-            raise ValueError("No valid path specified!")
+        path = self._to_abs_bucketpath(path)
         if len(path) > 0 and path[-1] != '/':
             path = path + '/'
 
@@ -433,21 +662,116 @@ class FileS3IO(HasGroups):
 
         if metadata is None:
             metadata = {}
-        self._bucket.put_object(Key=path, Body=data_obj, Metadata=metadata)
+        self._s3io._invalidate_listing(self._bucket.name, path)
+        if isinstance(data_obj, (bytes, bytearray)):
+            if len(data_obj) <= _transfer_config.multipart_threshold:
+                self._client.put_object(Bucket=self._bucket.name, Key=path, Body=data_obj, Metadata=metadata)
+                return
+            data_obj = io.BytesIO(data_obj)
+        self._client.upload_fileobj(
+            data_obj,
+            self._bucket.name,
+            path,
+            ExtraArgs={"Metadata": metadata},
+            Config=_transfer_config
+        )
+
+    def _list_objects(self, prefix=None, start_after=''):
+        """
+        Iterate over the objects below a prefix using the paginated low-level client.
+
+        Args:
+            prefix (str/None): key prefix inside the bucket, None means the current group.
+            start_after (str): only list keys lexicographically after this key.
+
+        Yields:
+            dict: object summary as returned by list_objects_v2 (e.g. 'Key', 'Size', 'LastModified').
+        """
+        if prefix is None:
+            prefix = self._bucket_path
+        paginator = self._client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self._bucket.name, Prefix=prefix, StartAfter=start_after,
+                                       PaginationConfig={'PageSize': 1000}):
+            yield from page.get('Contents', [])
+
+    def _glob_keys(self, prefix, pattern):
+        """
+        List the keys below a prefix which match a pattern, listing large subtrees concurrently.
+
+        If the keys do not fit into a single listing page, the remaining keys after the first page are listed per
+        direct sub group in parallel on the shared thread pool - as long as there are at most `_glob_fanout` sub
+        groups, otherwise one request per group costs more than paging through the keys and the listing continues
+        page by page. The keys are returned in lexicographic order in both cases.
+
+        Args:
+            prefix (str): key prefix inside the bucket.
+            pattern (re.Pattern): compiled pattern the keys have to match.
 
-    def _list_objects(self):
-        return self._bucket.objects.filter(Prefix=self._bucket_path)
+        Returns:
+            list: matching keys.
+        """
+        response = self._client.list_objects_v2(Bucket=self._bucket.name, Prefix=prefix)
+        keys = [obj['Key'] for obj in response.get('Contents', []) if pattern.match(obj['Key'])]
+        if not response.get('IsTruncated', False):
+            return keys
+        start_after = response['Contents'][-1]['Key']
+        # the sub group holding the last key of the first page is only partially listed and might not be reported
+        # as common prefix of the remaining keys, hence it is added explicitly.
+        sub_prefixes = set()
+        if '/' in start_after[len(prefix):]:
+            sub_prefixes.add(start_after[:start_after.index('/', len(prefix)) + 1])
+        top_keys = []
+        paginator = self._client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self._bucket.name, Prefix=prefix, Delimiter='/', StartAfter=start_after):
+            top_keys.extend(obj['Key'] for obj in page.get('Contents', []) if pattern.match(obj['Key']))
+            sub_prefixes.update(common_prefix['Prefix'] for common_prefix in page.get('CommonPrefixes', []))
+            if len(sub_prefixes) > self._glob_fanout:
+                keys.extend(self._match_keys(prefix, start_after, pattern))
+                return keys
+        futures = [_executor.submit(self._match_keys, sub_prefix, start_after, pattern) for sub_prefix in sub_prefixes]
+        keys.extend(heapq.merge(top_keys, *(future.result() for future in futures)))
+        return keys
+
+    def _match_keys(self, prefix, start_after, pattern):
+        """List the keys below a prefix after `start_after` which match a compiled pattern."""
+        return [obj['Key'] for obj in self._list_objects(prefix=prefix, start_after=start_after)
+                if pattern.match(obj['Key'])]
 
     def print_fileinfos(self):
         """
         Prints the filename, last modified date and size for all files in the current group,
         recursively including sub groups.
         """
-        for obj in self._bucket.objects.filter(Prefix=self._bucket_path):
-            print(f'/{obj.key} {obj.last_modified} {obj.size} bytes')
+        for obj in self._list_objects():
+            print(f'/{obj["Key"]} {obj["LastModified"]} {obj["Size"]} bytes')
+
+    def _iter_all_files_of_bucket(self, limit=None):
+        """
+        Iterate over the objects of the whole bucket, independent of the current group.
 
-    def _list_all_files_of_bucket(self):
-        return list(self._bucket.objects.all())
+        Args:
+            limit (int/None): maximal number of objects, None means no limit.
+
+        Yields:
+            dict: object summary as returned by list_objects_v2 (e.g. 'Key', 'Size', 'LastModified').
+        """
+        paginator = self._client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(Bucket=self._bucket.name, PaginationConfig={'MaxItems': limit, 'PageSize': 1000})
+        for page in pages:
+            yield from page.get('Contents', [])
+
+    def _list_all_files_of_bucket(self, limit=100000):
+        """
+        List the objects of the whole bucket, independent of the current group.
+
+        Args:
+            limit (int/None): maximal number of objects, the listing is silently truncated after `limit` objects.
+                None lists the complete bucket.
+
+        Returns:
+            list: object summaries (dict) as returned by list_objects_v2.
+        """
+        return list(self._iter_all_files_of_bucket(limit=limit))
 
     def glob(self, path):
         """
@@ -461,11 +785,10 @@ class FileS3IO(HasGroups):
             list: List of file names (str) matching the provided path pattern.
         """
         path = self._to_abs_bucketpath(path)
-        l = []
-        for obj in self._bucket.objects.filter(Prefix=self._bucket_path):
-            if fnmatch.fnmatchcase(obj.key, path):
-                l.append(obj.key)
-        return l
+        # only list below the literal part of the pattern in front of the first wildcard
+        prefix = re.split(r'[*?\[]', path, maxsplit=1)[0]
+        pattern = re.compile(fnmatch.translate(path))
+        return self._glob_keys(prefix, pattern)
 
     @staticmethod
     def print_file_info(filelist):
@@ -473,10 +796,14 @@ class FileS3IO(HasGroups):
         Prints filename, last_modified, and size of each file in the provided list of file objects.
 
         Args:
-            filelist (list): List containing objects from a bucket.
+            filelist (list): List containing objects from a bucket (s3.ObjectSummary) or object summaries (dict) as
+                returned by list_objects_v2.
         """
         for obj in filelist:
-            print(f'/{obj.key} {obj.last_modified} {obj.size} bytes')
+            if isinstance(obj, dict):
+                print(f'/{obj["Key"]} {obj["LastModified"]} {obj["Size"]} bytes')
+            else:
+                print(f'/{obj.key} {obj.last_modified} {obj.size} bytes')
 
     def remove_file(self, file):
         """
@@ -488,6 +815,7 @@ class FileS3IO(HasGroups):
         if not self.is_file(file):
             raise ValueError(f"{file} is not a file.")
         file = self._to_abs_bucketpath(file)
+        self._s3io._invalidate_listing(self._bucket.name, file)
         self._bucket.Object(file).delete()
         #self._remove_object(prefix=file, debug=debug)
 
@@ -513,14 +841,34 @@ class FileS3IO(HasGroups):
         Args:
             prefix(str): All objects with this prefix will be removed.
             debug(bool): If True, additional information is printed.
+
+        Raises:
+            RuntimeError: if some of the objects could not be deleted.
         """
         if debug:
             print(f'\nDeleting all objects with sample prefix {self._bucket.name}/{prefix}.')
-        delete_responses = self._bucket.objects.filter(Prefix=prefix).delete()
-        if debug:
-            for delete_response in delete_responses:
-                for deleted in delete_response['Deleted']:
+        self._s3io._invalidate_listing(self._bucket.name, prefix)
+        # each listing page holds at most 1000 keys, the limit of a single delete_objects request
+        futures = []
+        paginator = self._client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self._bucket.name, Prefix=prefix, PaginationConfig={'PageSize': 1000}):
+            objects = [{'Key': obj['Key']} for obj in page.get('Contents', [])]
+            if len(objects) > 0:
+                futures.append(_executor.submit(
+                    self._client.delete_objects,
+                    Bucket=self._bucket.name,
+                    Delete={'Objects': objects, 'Quiet': not debug}
+                ))
+        errors = []
+        for future in futures:
+            delete_response = future.result()
+            errors.extend(delete_response.get('Errors', []))
+            if debug:
+                for deleted in delete_response.get('Deleted', []):
                     print(f'\t Deleted: {deleted["Key"]}')
+        if len(errors) > 0:
+            failed = {error["Key"]: error.get("Code") for error in errors}
+            raise RuntimeError(f"Could not delete {len(failed)} objects with prefix {prefix}: {failed}")
 
     def __enter__(self):
         """Compatibility function for the with statement."""
@@ -556,9 +904,10 @@ class FileS3IO(HasGroups):
             if len(item_lst) == 1 and item_lst[0] != "..":
                 if item == "":
                     return self
-                if item in self.list_nodes():
+                groups, nodes = self._list_group_content()
+                if item in nodes:
                     return self.get(item)
-                if item in self.list_groups():
+                if item in groups:
                     return self.open(item)
                 raise ValueError(f"Unknown item: {item}")
             else:
@@ -1,10 +1,13 @@
 import unittest
 import os
 import json
+import threading
+import time
+from unittest import mock
 
 from moto import mock_s3
 import boto3
-from pyiron_contrib.generic.s3io import FileS3IO
+from pyiron_contrib.generic.s3io import FileS3IO, _transfer_config
 
 MY_BUCKET = "MY_BUCKET"
 TEST_BUCKET = "TEST_BUCKET"
@@ -91,12 +94,46 @@ class TestS3IO(unittest.TestCase):
         self.assertTrue(s3io._bucket == self.bucket)
         s3io = FileS3IO(credentials_w_bucket)
         self.assertTrue(s3io._bucket == self.bucket)
+        self.assertIs(s3io._s3io.s3resource, FileS3IO(credentials, bucket_name=TEST_BUCKET)._s3io.s3resource)
+        thread_resources = []
+        thread = threading.Thread(
+            target=lambda: thread_resources.append(FileS3IO(credentials_w_bucket)._s3io.s3resource)
+        )
+        thread.start()
+        thread.join()
+        self.assertIsNot(s3io._s3io.s3resource, thread_resources[0])
 
     def test_list(self):
         self.assertEqual(self.s3io.list_all(), {'groups': ['random', 'some'], 'nodes': ['any', 'other', 'other2']})
         self.assertEqual(self.s3io.list_groups(), ['random', 'some'])
         self.assertEqual(self.s3io.list_nodes(), ['any', 'other', 'other2'])
 
+    def test_list_ttl(self):
+        self.assertNotIn('new_file', self.s3io_io.list_nodes())
+        self.s3io_io.copy().put(b'new', filename='new_file')
+        self.assertIn('new_file', self.s3io_io.list_nodes())
+
+        self.assertNotIn('new_grp', self.s3io_io.list_groups())
+        self.s3io_io.open('new_grp').upload([self.current_dir + '/some_file.txt'])
+        self.assertIsInstance(self.s3io_io['new_grp'], FileS3IO)
+        self.assertIn('some_file.txt', self.s3io_io['new_grp'].list_nodes())
+        self.s3io_io.open('new_grp').remove_group()
+        self.assertNotIn('new_grp', self.s3io_io.list_groups())
+
+        # changes through another connection are only visible after the ttl
+        self.assertNotIn('other_conn', self.s3io_io.list_nodes())
+        FileS3IO(self.res, bucket_name=TEST_BUCKET).put(b'new', filename='other_conn')
+        self.assertNotIn('other_conn', self.s3io_io.list_nodes())
+        self.s3io_io._listing_ttl = 0
+        self.assertIn('other_conn', self.s3io_io.list_nodes())
+
+    def test_print_file_info(self):
+        with mock.patch('builtins.print') as mock_print:
+            FileS3IO.print_file_info(list(self.bucket.objects.filter(Prefix='some/path_to')))
+            FileS3IO.print_file_info(self.s3io._list_all_files_of_bucket(limit=2))
+        printed = [call.args[0].split()[0] for call in mock_print.call_args_list]
+        self.assertEqual(printed, ['/some/path_to/any', '/some/path_to/some', '/any', '/other'])
+
     def test_get_s3_object(self):
         other = self.s3io.get_s3_object('other')
         self.assertEqual(other["Metadata"], {'file_loc': '/'})
@@ -106,6 +143,15 @@ class TestS3IO(unittest.TestCase):
         other = self.s3io.get('other')
         self.assertEqual(other.metadata, {'file_loc': '/'})
         self.assertEqual(other.data, [b'any text'])
+        self.assertIs(other.data, other.data)
+
+    def test_get_ranges(self):
+        self.assertEqual(self.s3io.get_ranges('other2', [(0, 4), (5, 9), (2, 3)]), [b'some', b'text', b'm'])
+        self.assertEqual(self.s3io.open('some').get_ranges('path_to/any', [(4, 8)]), [b'path'])
+        self.assertEqual(self.s3io.get_ranges('other2', [(5, 5), (6, 2), (0, 4)]), [b'', b'', b'some'])
+        self.assertEqual(self.s3io.get_ranges('other2', [(9, 12), (20, 30), (5, 30)]), [b'', b'', b'text'])
+        self.assertRaises(ValueError, self.s3io.get_ranges, 'other2', [(-1, 4)])
+        self.assertRaises(ValueError, self.s3io.get_ranges, 'other2', [(0, 4.0)])
 
     def test_put(self):
         with open(os.path.join(self.current_dir, 'some_file.txt'), 'rb') as f:
@@ -132,6 +178,18 @@ class TestS3IO(unittest.TestCase):
         self.assertEqual(s3_obj['Body'].read(), b'random text')
         self.assertEqual(s3_obj['Metadata'], {'random': 'metadata'})
 
+        self.s3io_io.put(b'new group', filename="file", path="new_group")
+        self.assertTrue(self.s3io_io.is_dir('new_group'))
+        self.assertEqual(self.s3io_io.get_s3_object('new_group/file')['Body'].read(), b'new group')
+
+        # just above the threshold, uploaded as multipart upload
+        large_data = b'0123456789abcdef' * (_transfer_config.multipart_threshold // 16) + b'0'
+        self.s3io_io.put(large_data, filename="large", metadata={'random': 'metadata'})
+        s3_obj = self.s3io_io.get_s3_object('large')
+        self.assertEqual(s3_obj['Body'].read(), large_data)
+        self.assertEqual(s3_obj['Metadata'], {'random': 'metadata'})
+        self.assertIn('-', s3_obj['ETag'])
+
     def test_open(self):
         some = self.s3io.open('some')
         self.assertEqual(some.list_all(), {'groups': ['path_to'], 'nodes': ['path']})
@@ -153,6 +211,23 @@ class TestS3IO(unittest.TestCase):
 
     def test_glob(self):
         self.assertEqual(self.s3io.glob('some/path???/*'), ['some/path_to/any', 'some/path_to/some'])
+        self.assertEqual(self.s3io.glob('*/location'), ['random/location'])
+        self.assertEqual(self.s3io.open('some').glob('/other*'), ['other', 'other2'])
+
+        # more than one listing page, the page boundary falls into the middle of the sub group 'many/b/'
+        bucket = self.res.Bucket(TEST_BUCKET)
+        keys = ['many/top'] + ['many/{}/{:04d}'.format(grp, i) for grp in 'ab' for i in range(600)]
+        for key in keys:
+            bucket.put_object(Key=key, Body=b'')
+        self.assertEqual(self.s3io_io.glob('many/*'), sorted(keys))
+        self.assertEqual(self.s3io_io.glob('many/b/05*'), ['many/b/{:04d}'.format(i) for i in range(500, 600)])
+
+        # too many sub groups for a concurrent listing, the remaining keys are listed page by page
+        self.s3io_io._glob_fanout = 1
+        with mock.patch.object(self.s3io_io, '_match_keys', wraps=self.s3io_io._match_keys) as match_keys:
+            self.assertEqual(self.s3io_io.glob('*'), sorted(keys + ['grp_to_be_removed/some', 'other', 'some/path',
+                                                                     'to_be_removed']))
+        match_keys.assert_called_once()
 
     def test_download(self):
         self.assertFalse(os.path.exists(self.current_dir + '/any'))
@@ -161,6 +236,28 @@ class TestS3IO(unittest.TestCase):
             self.assertEqual(f.read(), 'any text')
         os.remove(self.current_dir + '/any')
 
+        self.s3io.download(['other', 'other2'], self.current_dir)
+        with open(os.path.join(self.current_dir, 'other')) as f:
+            self.assertEqual(f.read(), 'any text')
+        with open(os.path.join(self.current_dir, 'other2')) as f:
+            self.assertEqual(f.read(), 'some text')
+        os.remove(self.current_dir + '/other')
+        os.remove(self.current_dir + '/other2')
+
+        # a failing transfer is only reported once all other transfers finished
+        finished = []
+
+        def download_file(bucket, key, filepath, **kwargs):
+            if key == 'any':
+                raise OSError('download failed')
+            time.sleep(0.2)
+            finished.append(key)
+
+        with mock.patch.object(self.s3io._client, 'download_file', side_effect=download_file):
+            with self.assertRaises(OSError):
+                self.s3io.download(['any', 'other'], self.current_dir)
+        self.assertEqual(finished, ['other'])
+
     def test___getitem__(self):
         other = self.s3io['other']
         self.assertEqual(other.metadata, {'file_loc': '/'})
@@ -183,18 +280,38 @@ class TestS3IO(unittest.TestCase):
     def test_get_metadata(self):
         self.assertEqual(self.s3io.get_metadata('other'), {'file_loc': '/'})
 
+    def test_set_metadata(self):
+        self.s3io_io.set_metadata('some/path', {'new': 'metadata'})
+        self.assertEqual(self.s3io_io.get_metadata('some/path'), {'new': 'metadata'})
+        self.assertEqual(self.s3io_io.get_s3_object('some/path')['Body'].read(), b'some text')
+
+        self.i_o_bucket.put_object(
+            Key='typed', Body=b'typed text', ContentType='text/plain', StorageClass='STANDARD_IA'
+        )
+        self.s3io_io.set_metadata('typed', {'new': 'metadata'})
+        head = self.res.meta.client.head_object(Bucket=TEST_BUCKET, Key='typed')
+        self.assertEqual(head['ContentType'], 'text/plain')
+        self.assertEqual(head['StorageClass'], 'STANDARD_IA')
+        self.assertEqual(head['Metadata'], {'new': 'metadata'})
+
     def test_is_file(self):
         self.assertTrue(self.s3io.is_file('other'))
         self.assertFalse(self.s3io.is_file('some'))
+        self.assertFalse(self.s3io.is_file('does_not_exist'))
+        self.assertTrue(self.s3io.is_file('some/path_to/any'))
 
     def test_is_dir(self):
         self.assertTrue(self.s3io.is_dir('some'))
+        self.assertTrue(self.s3io.is_dir('some/path_to'))
         self.assertFalse(self.s3io.is_dir('other'))
+        self.assertFalse(self.s3io.is_dir('does_not_exist'))
 
     def test_upload(self):
         file = self.current_dir + '/some_file.txt'
+        self.assertNotIn('some_file.txt', self.s3io_io.list_nodes())
         self.s3io_io.upload([file])
         self.assertTrue(self.s3io_io.is_file('some_file.txt'))
+        self.assertIn('some_file.txt', self.s3io_io.list_nodes())
         self.assertEqual(self.s3io_io.get_s3_object('some_file.txt')['Body'].read().decode('utf8'), 'text')
 
     def test_remove_file(self):
@@ -207,6 +324,18 @@ class TestS3IO(unittest.TestCase):
         self.s3io_io.remove_group('grp_to_be_removed')
         self.assertFalse(self.s3io_io.is_dir('grp_to_be_removed'))
 
+        client = self.res.meta.client
+        for i in range(1001):
+            client.put_object(Bucket=TEST_BUCKET, Key=f'large_grp/{i:04d}', Body=b'')
+        self.s3io_io.remove_group('large_grp')
+        self.assertFalse(self.s3io_io.is_dir('large_grp'))
+        self.assertTrue(self.s3io_io.is_file('other'))
+
+        failed_response = {'Errors': [{'Key': 'some/path', 'Code': 'AccessDenied', 'Message': 'Access Denied'}]}
+        with mock.patch.object(self.s3io_io._client, 'delete_objects', return_value=failed_response):
+            with self.assertRaises(RuntimeError):
+                self.s3io_io.remove_group('some')
+
 
 if __name__ == '__main__':
     unittest.main()